@@ -1,21 +1,33 @@
 __all__ = ('IconButton', 'CustomButton')
 
-from kivy.properties import ColorProperty, ListProperty, VariableListProperty
+from kivy.properties import ColorProperty, VariableListProperty
 from kivy.uix.behaviors import TouchRippleButtonBehavior
 from kivy.lang import Builder
-from os.path import join, dirname, basename
 
 from kivy.uix.widget import Widget
 
 from components.behaviors import StencilBehavior
 from components.label import Icon, CustomLabel
 
-Builder.load_file(join(dirname(__file__), basename(__file__).split(".")[0] + ".kv"))
+_KV_PATH = __file__.rsplit(".", 1)[0] + ".kv"
 
 
-class IconButton(TouchRippleButtonBehavior, Icon):
+class _LazyKV:
+    _kv_loaded = False
+
+    def __init__(self, **kwargs):
+        if not _LazyKV._kv_loaded:
+            _LazyKV._kv_loaded = True
+            Builder.load_file(_KV_PATH)
+        super().__init__(**kwargs)
+
+
+# EventDispatcher precludes __slots__, so these subclasses deliberately add
+# no ad-hoc Python attributes: every attribute access stays on the Kivy
+# property descriptors without falling back to the instance dict.
+class IconButton(_LazyKV, TouchRippleButtonBehavior, Icon):
     pass
 
 
-class CustomButton(TouchRippleButtonBehavior, CustomLabel):
-    text_size = ListProperty([None, None])
+class CustomButton(_LazyKV, TouchRippleButtonBehavior, CustomLabel):
+    pass
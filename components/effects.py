@@ -6,41 +6,50 @@ from kivy.properties import NumericProperty
 from kivy.effects.dampedscroll import DampedScrollEffect
 
 
+_OVERSCROLL_EVENTS = ("on_overscroll_up", "on_overscroll_down")
+
+
+def _dispatch_sv_overscroll(effect, args):
+    # Resolve (and remember) whether the owning scroll view handles the
+    # overscroll events, so the per-tick path skips the hasattr probe.
+    sv = effect._overscroll_target
+    if sv is None:
+        sv = effect.target_widget.parent
+        sv = sv if hasattr(sv, "on_overscroll") else False
+        effect._overscroll_target = sv
+    if sv:
+        sv.dispatch("on_overscroll", *args)
+        sv.dispatch(_OVERSCROLL_EVENTS[args[1] < 0])
+
+
 class LowerScrollEffect(ScrollEffect):
     friction = NumericProperty(0.035)
+    _overscroll_target = None
 
     def on_overscroll(self, *args):
-        sv = self.target_widget.parent
-        if hasattr(sv, "on_overscroll"):
-            sv.dispatch("on_overscroll", *args)
-            if args[1] < 0:
-                sv.dispatch("on_overscroll_down")
-            else:
-                sv.dispatch("on_overscroll_up")
+        _dispatch_sv_overscroll(self, args)
 
 
-class HardStopScrollEffect(LowerScrollEffect):
+class _HardStopMixin:
     def stop(self, val, t=None):
         return super().stop(val, t=0.01)
 
 
+class HardStopScrollEffect(_HardStopMixin, LowerScrollEffect):
+    pass
+
+
 class LowerDampedScrollEffect(DampedScrollEffect):
     friction = NumericProperty(.035)
+    _overscroll_target = None
 
     def on_overscroll(self, *args):
         super().on_overscroll(*args)
-        sv = self.target_widget.parent
-        if hasattr(sv, "on_overscroll"):
-            sv.dispatch("on_overscroll", *args)
-            if args[1] < 0:
-                sv.dispatch("on_overscroll_down")
-            else:
-                sv.dispatch("on_overscroll_up")
+        _dispatch_sv_overscroll(self, args)
 
 
-class HardStopDampedScrollEffect(LowerDampedScrollEffect):
-    def stop(self, val, t=None):
-        return super().stop(val, t=0.01)
+class HardStopDampedScrollEffect(_HardStopMixin, LowerDampedScrollEffect):
+    pass
 
 
 class StretchOverScrollStencil(ScrollEffect):
@@ -73,25 +82,58 @@ class StretchOverScrollStencil(ScrollEffect):
 
     scroll_view = None  # scroll view instance
     scroll_scale = None  # Scale instruction instance
+    _overscroll_target = None
 
-    scale_axis = "y"  # axis of effect
+    _scale_axis = "y"  # axis of effect
     last_touch_pos = None  # used to calculate distance
 
-    @staticmethod
-    def clamp(value, min_val=0, max_val=0):
-        return min(max(value, min_val), max_val)
-
-    def is_top_or_bottom(self):
-        return getattr(self.scroll_view, "scroll_" + self.scale_axis) in [1, 0]
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sync_axis_cache()
+        self._impact_anim = Animation(d=0)
+        self._impact_anim.bind(on_complete=self.reset_scale)
+        self._reset_anim = Animation(d=0.2)
+
+    @property
+    def scale_axis(self):
+        return self._scale_axis
+
+    @scale_axis.setter
+    def scale_axis(self, axis):
+        self._scale_axis = axis
+        self._sync_axis_cache()
+
+    def _sync_axis_cache(self):
+        # The axis never changes once the scroll view wires up the effect,
+        # so everything derived from it is computed here instead of inside
+        # the per-touch-event methods, and the per-frame methods are swapped
+        # for implementations with the axis attribute baked in.
+        self._is_y = self._scale_axis == "y"
+        self._exp_scalar_neg = -self.exponential_scalar
+        if self._is_y:
+            self.is_top_or_bottom = self._is_top_or_bottom_y
+            self.convert_overscroll = self._convert_overscroll_y
+        else:
+            self.is_top_or_bottom = self._is_top_or_bottom_x
+            self.convert_overscroll = self._convert_overscroll_x
+
+    def _is_top_or_bottom_y(self):
+        v = self.scroll_view.scroll_y
+        return v == 0 or v == 1
+
+    def _is_top_or_bottom_x(self):
+        v = self.scroll_view.scroll_x
+        return v == 0 or v == 1
 
     _should_absorb = True
 
     def on_value(self, stencil, scroll_distance):
         super().on_value(stencil, scroll_distance)
         if self.target_widget:
-            if not all([self.scroll_view, self.scroll_scale]):
-                self.scroll_view = self.target_widget.parent
-                self.scroll_scale = self.scroll_view._internal_scale
+            if self.scroll_view is None:
+                sv = self.target_widget.parent
+                self.scroll_view = sv
+                self.scroll_scale = sv._internal_scale
 
             if self.is_top_or_bottom():
                 if (
@@ -104,15 +146,13 @@ class StretchOverScrollStencil(ScrollEffect):
             else:
                 self._should_absorb = True
 
-    def get_hw(self):
-        return "height" if self.scale_axis == "y" else "width"
-
     def set_scale_origin(self):
         # Check if target size is small than scrollview
         # if yes don't stretch scroll view.
-        if getattr(self.target_widget, self.get_hw()) < getattr(
-            self.scroll_view, self.get_hw()
-        ):
+        if self._is_y:
+            if self.target_widget.height < self.scroll_view.height:
+                return False
+        elif self.target_widget.width < self.scroll_view.width:
             return False
 
         self.scroll_scale.origin = [
@@ -123,66 +163,69 @@ class StretchOverScrollStencil(ScrollEffect):
 
     def absorb_impact(self):
         self.set_scale_origin()
-        sanitized_velocity = self.clamp(
-            abs(self.velocity), 1, self.maximum_velocity
+        v = abs(self.velocity)
+        sanitized_velocity = (
+            1 if v < 1 else (self.maximum_velocity if v > self.maximum_velocity else v)
         )
         # Approx implementation.
         new_scale = 1 + min(
             (sanitized_velocity / self.approx_normailzer),
             1 / 3,
         )
-        init_anim = Animation(
-            **{self.scale_axis: new_scale},
-            d=(sanitized_velocity * 4) / 1e6,
-        )
-        init_anim.bind(on_complete=self.reset_scale)
-        init_anim.start(self.scroll_scale)
-
-    def get_component(self, pos):
-        return pos[-1 if self.scale_axis == "y" else 1]
-
-    def convert_overscroll(self, touch):
+        anim = self._impact_anim
+        anim.animated_properties.clear()
+        anim.animated_properties[self._scale_axis] = new_scale
+        anim._duration = (sanitized_velocity * 4) / 1e6
+        anim.start(self.scroll_scale)
+
+    def _convert_overscroll_y(self, touch):
+        scroll_view = self.scroll_view
         if (
-            self.scroll_view
-            and self.scroll_view.collide_point(*touch.pos)
+            scroll_view
+            and scroll_view.collide_point(*touch.pos)
             and self.is_top_or_bottom()
-            and getattr(self.scroll_view, "do_scroll_" + self.scale_axis)
+            and scroll_view.do_scroll_y
             and self.velocity == 0
             and self.set_scale_origin()  # sets stretch direction
         ):
             # Distance travelled by touch divided by size of scrollview.
             distance = (
-                abs(
-                    self.get_component(touch.pos)
-                    - self.get_component(self.last_touch_pos)
-                )
-                / self.scroll_view.height
+                abs(touch.pos[-1] - self.last_touch_pos[-1])
+                / scroll_view.height
             )
-            # Constant scale due to distance.
-            linear_intensity = self.stretch_intensity * distance
-            # Far the touch -> less it stretches.
-            exponential_intensity = self.stretch_intensity * (
-                1 - math.exp(-distance * self.exponential_scalar)
+            # Linear part grows with distance, exponential part decays the
+            # further the touch travels; both share one intensity factor.
+            self.scroll_scale.y = 1.0 + self.stretch_intensity * (
+                distance + 1.0 - math.exp(distance * self._exp_scalar_neg)
+            )
+
+    def _convert_overscroll_x(self, touch):
+        scroll_view = self.scroll_view
+        if (
+            scroll_view
+            and scroll_view.collide_point(*touch.pos)
+            and self.is_top_or_bottom()
+            and scroll_view.do_scroll_x
+            and self.velocity == 0
+            and self.set_scale_origin()  # sets stretch direction
+        ):
+            distance = (
+                abs(touch.pos[1] - self.last_touch_pos[1])
+                / scroll_view.height
+            )
+            self.scroll_scale.x = 1.0 + self.stretch_intensity * (
+                distance + 1.0 - math.exp(distance * self._exp_scalar_neg)
             )
-            new_scale = 1 + exponential_intensity + linear_intensity
-            setattr(self.scroll_scale, self.scale_axis, new_scale)
 
     def reset_scale(self, *arg):
         if not self.scroll_scale:
             return
-        _scale = getattr(self.scroll_scale, self.scale_axis)
+        _scale = getattr(self.scroll_scale, self._scale_axis)
         if _scale > 1:
-            anim = Animation(
-                **{self.scale_axis: 1},
-                d=0.2,
-            )
+            anim = self._reset_anim
+            anim.animated_properties.clear()
+            anim.animated_properties[self._scale_axis] = 1
             anim.start(self.scroll_scale)
 
     def on_overscroll(self, *args):
-        sv = self.target_widget.parent
-        if hasattr(sv, "on_overscroll"):
-            sv.dispatch("on_overscroll", *args)
-            if args[1] < 0:
-                sv.dispatch("on_overscroll_down")
-            else:
-                sv.dispatch("on_overscroll_up")
\ No newline at end of file
+        _dispatch_sv_overscroll(self, args)
\ No newline at end of file
@@ -1,33 +1,38 @@
 __all__ = ("BaseSheet", "OtpSheet",)
 
+import weakref
+
 from kivy.animation import Animation
 from kivy.clock import mainthread
 from kivy.metrics import dp
 from kivy.properties import VariableListProperty, NumericProperty, StringProperty, BooleanProperty, ObjectProperty
-from kivy.clock import ClockEvent, Clock
+from kivy.clock import Clock
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
 from kivy.lang import Builder
-from os.path import join, dirname, basename
 from kivy.core.window import Window
 from kivy.uix.modalview import ModalView
 
 from components.behaviors import AdaptiveBehavior
 from kivy import platform
 
-Builder.load_file(join(dirname(__file__), basename(__file__).split(".")[0] + ".kv"))
-
-clock: ClockEvent = None
+_KV_PATH = __file__.rsplit(".", 1)[0] + ".kv"
+_kv_loaded = False
 
 
 class BaseSheet(ButtonBehavior, BoxLayout):
     __events__ = ("on_open", "on_dismiss")
+    _active_instances = weakref.WeakValueDictionary()
     is_open = BooleanProperty(False)
     screen = ObjectProperty()
     radius = VariableListProperty(["20dp", "20dp", 0, 0])
     bottom_padding = NumericProperty("20dp")
 
     def __init__(self, **kwargs):
+        global _kv_loaded
+        if not _kv_loaded:
+            Builder.load_file(_KV_PATH)
+            _kv_loaded = True
         super().__init__(**kwargs)
         self.modalview = ModalView(
             background_color=(0, 0, 0, 0),
@@ -35,6 +40,10 @@ class BaseSheet(ButtonBehavior, BoxLayout):
             overlay_color=(0, 0, 0, .4),
             auto_dismiss=False,
         )
+        self._open_anim = Animation(y=0, duration=.2)
+        self._open_anim.bind(on_complete=self._on_open_complete)
+        self._dismiss_anim = Animation(y=0, duration=.2)
+        self._dismiss_anim.bind(on_complete=self._dismiss)
         if platform == "android":
             from kvdroid.tools.display import get_navbar_height
             self.bottom_padding = self.bottom_padding + get_navbar_height()
@@ -42,29 +51,29 @@ class BaseSheet(ButtonBehavior, BoxLayout):
     def open(self):
         if self.is_open:
             return
-        for child in Window.children:
-            if child.__class__ == self.__class__:
-                del self
-                return
+        if self.__class__ in BaseSheet._active_instances:
+            return
+        BaseSheet._active_instances[self.__class__] = self
         self.modalview.open(animate=True)
         Window.add_widget(self)
         self._open()
 
     def _open(self):
-        anim = Animation(y=0, duration=.2)
-        anim.bind(on_complete=lambda *_: self.dispatch("on_open"))
-        anim.start(self)
+        self._open_anim.start(self)
         self.is_open = True
 
+    def _on_open_complete(self, *_):
+        self.dispatch("on_open")
+
     def dismiss(self):
         if not self.is_open:
             return
-        anim = Animation(y=-self.height - dp(50), duration=.2)
-        anim.bind(on_complete=self._dismiss)
-        anim.start(self)
+        self._dismiss_anim.animated_properties["y"] = -self.height - dp(50)
+        self._dismiss_anim.start(self)
         self.is_open = False
 
     def _dismiss(self, *_):
+        BaseSheet._active_instances.pop(self.__class__, None)
         Window.remove_widget(self)
         self.modalview.dismiss()
         self.dispatch("on_dismiss")
@@ -78,30 +87,44 @@ class BaseSheet(ButtonBehavior, BoxLayout):
 
 class OtpSheet(BaseSheet, AdaptiveBehavior):
     __events__ = ("on_submit_otp", "on_resend_otp")
-    timeout = NumericProperty(60)
+    _DEFAULT_TIMEOUT = 60
+    timeout = NumericProperty(_DEFAULT_TIMEOUT)
     phone_number = StringProperty("08136346373")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        global clock
-        self._countdown_callback = lambda _: setattr(self, "timeout", self.timeout - 1)
-        clock = Clock.create_trigger(
+        self._end_time = 0
+        self._clock = Clock.create_trigger(
             self._countdown_callback,
             timeout=1,
             interval=True
         )
-        self.bind(timeout=lambda _, tmo: clock.cancel() if tmo == 0 else None)
+
+    def _countdown_callback(self, _dt):
+        remaining = int(self._end_time - Clock.get_time())
+        if remaining <= 0:
+            self.timeout = 0
+            self._clock.cancel()
+            return
+        if remaining != self.timeout:
+            self.timeout = remaining
 
     def _open(self):
-        anim = Animation(y=0, duration=.2)
-        anim.bind(on_complete=lambda *_: clock())
-        anim.start(self)
+        # Reset the displayed countdown too: the first tick only lands 1s
+        # after the open animation, and a stale 0 leaves the resend button
+        # enabled until then.
+        self.timeout = self._DEFAULT_TIMEOUT
+        self._end_time = Clock.get_time() + self._DEFAULT_TIMEOUT
+        self._open_anim.start(self)
         self.is_open = True
         self.dispatch("on_open", self)
 
+    def _on_open_complete(self, *_):
+        self._clock()
+
     def _dismiss(self, *_):
         super()._dismiss(*_)
-        clock.cancel()
+        self._clock.cancel()
 
     def submit_otp(self):
         if self.ids.spinner.active:
@@ -112,8 +135,9 @@ class OtpSheet(BaseSheet, AdaptiveBehavior):
 
     def resend_otp(self):
         self.dispatch("on_resend_otp")
-        self.timeout = self.property("timeout").defaultvalue
-        clock()
+        self.timeout = self._DEFAULT_TIMEOUT
+        self._end_time = Clock.get_time() + self.timeout
+        self._clock()
 
     def stop_spinner(self):
         self.ids.spinner.active = False
@@ -43,7 +43,7 @@ class BaseScreen(Screen):
         toast(text, length_long)
 
     @staticmethod
-    def put_extra(key, value):
+    def put_extra(key, value, _store=screen_extras):
         """
         Adds an extra key-value pair to the global `screen_extras` dictionary.
 
@@ -58,10 +58,10 @@ class BaseScreen(Screen):
         :type value: Any
         :return: None
         """
-        screen_extras[key] = value
+        _store[key] = value
 
     @staticmethod
-    def get_extra(key, default=None):
+    def get_extra(key, default=None, _store=screen_extras):
         """
         Retrieve a value from a dictionary using a given key or return a default value.
 
@@ -78,10 +78,10 @@ class BaseScreen(Screen):
                  otherwise, the default value.
         :rtype: Any
         """
-        return screen_extras.get(key, default)
+        return _store.get(key, default)
 
     @staticmethod
-    def remove_extra(key):
+    def remove_extra(key, _store=screen_extras):
         """
         Removes a specified key from the global dictionary `screen_extras`.
 
@@ -96,4 +96,4 @@ class BaseScreen(Screen):
             This method does not return any value.
 
         """
-        del screen_extras[key]
+        _store.pop(key, None)
@@ -1,20 +1,41 @@
-from os.path import join, dirname, basename
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from os import makedirs
 
 from kivy.animation import Animation
-from kivy.clock import triggered
+from kivy.app import App
+from kivy.clock import Clock, triggered
 from kivy.lang import Builder
 from kivy.metrics import sp, dp
-from kivy.properties import StringProperty
+from kivy.properties import NumericProperty, StringProperty
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
-from kvdroid.tools.audio import get_all_audio_files
-from kvdroid.tools.appsource import app_dirs
-from kvdroid.tools.exoplayer import ExoPlayer
+from kivy import platform
+
+if platform == "android":
+    from android.permissions import request_permissions, Permission  # noqa
+    from kvdroid.tools.audio import get_all_audio_files
+    from kvdroid.tools.appsource import app_dirs
+    from kvdroid.tools.exoplayer import ExoPlayer
+else:
+    request_permissions = Permission = None
+    get_all_audio_files = app_dirs = ExoPlayer = None
+
 from features.basescreen import BaseScreen
 from libs.image import extract_thumbnail_file_from_mp3
 from libs.serialize import serialize
 
-Builder.load_file(join(dirname(__file__), basename(__file__).split(".")[0] + ".kv"))
+_KV_PATH = __file__.rsplit(".", 1)[0] + ".kv"
+_kv_loaded = False
+
+_PLACEHOLDER_THUMBNAIL = "assets/images/thumbnail.png"
+_PLAYLIST_BATCH_SIZE = 20
+# Pixel offsets used by the push_down transition, resolved from dp once
+# instead of on every call.
+_CONTAINER_PEEK_HEIGHT = dp(100)
+_OVERLAY_BTN_HIDE_MARGIN = dp(10)
+_media_executor = ThreadPoolExecutor(max_workers=4)
 
 
 class PlayerScreen(BaseScreen):
@@ -42,9 +63,63 @@ class PlayerScreen(BaseScreen):
         :param kwargs: Additional keyword arguments for further configurations. These are not directly
                        utilized within this initializer.
         """
+        global _kv_loaded
+        if not _kv_loaded:
+            Builder.load_file(_KV_PATH)
+            _kv_loaded = True
         super().__init__(**kwargs)
         self.player = ExoPlayer()
         self.permission_granted = False
+        self._last_media_index = None
+        self._last_progress_bucket = None
+        self._listener_attached = False
+        self._pump_event = None
+
+    def on_kv_post(self, base_widget):
+        """
+        Snapshots the widgets the animation and progress paths keep touching
+        into plain attributes, so the frequently-called methods skip the
+        ObservableDict/WeakProxy resolution behind ``self.ids``.
+
+        :param base_widget: The base widget the kv rules were applied to.
+        :return: None
+        """
+        ids = self.ids
+        self._rv = ids.rv
+        self._overlay_btn = ids.overlay_btn
+        self._playlist_container = ids.playlist_container
+        self._player_container = ids.player_container
+        self._player_preview = ids.player_preview
+        self._preview_play_btn = ids.preview_play_btn
+        self._container_play_btn = ids.container_play_btn
+        self._preview_title = ids.preview_title
+        self._container_title = ids.container_title
+        self._preview_artist = ids.preview_artist
+        self._container_artist = ids.container_artist
+        self._preview_thumbnail = ids.preview_thumbnail
+        self._container_thumbnail = ids.container_thumbnail
+        self._preview_progress = ids.preview_progress
+        self._container_progress = ids.container_progress
+        # The transition animations are built once and retargeted per call
+        # (same reuse pattern as absorb_impact in components/effects.py).
+        # Kivy ticks every running Animation from one class-level Clock
+        # callback, so reuse here is about killing the per-call Animation
+        # allocations and on_complete binds, not the tick count.
+        self._rv_fade_out = Animation(opacity=0, d=.2)
+        self._rv_fade_in = Animation(opacity=1, d=.2)
+        self._overlay_show_anim = Animation(y=0, opacity=1, d=.2)
+        self._overlay_hide_anim = Animation(y=0, opacity=0, d=.2)
+        self._playlist_up_anim = Animation(y=0, d=.2)
+        self._playlist_down_anim = Animation(y=0, d=.2)
+        self._container_up_anim = Animation(y=0, opacity=1, d=.2)
+        self._container_down_anim = Animation(y=0, opacity=0, d=.2)
+        self._preview_hide_anim = Animation(y=0, opacity=0, d=.2)
+        self._preview_hide_anim.bind(on_complete=self._restart_progress)
+        self._preview_show_anim = Animation(y=0, opacity=1, d=.2)
+        self._preview_show_anim.bind(on_complete=self._restart_progress)
+
+    def _restart_progress(self, *_):
+        self.update_progress()
 
     def push_up(self):
         """
@@ -61,23 +136,25 @@ class PlayerScreen(BaseScreen):
         """
         self.update_progress.cancel()
 
-        Animation(opacity=0, d=.2).start(self.ids.rv)
+        self._rv_fade_out.start(self._rv)
 
-        Animation(y=0, opacity=1, d=.2).start(self.ids.overlay_btn)
+        self._overlay_show_anim.start(self._overlay_btn)
 
-        playlist_container = self.ids.playlist_container
-        playlist_container_y = playlist_container.height + self.app.navbar_height
-        Animation(y=playlist_container_y, d=.2).start(playlist_container)
+        playlist_container = self._playlist_container
+        anim = self._playlist_up_anim
+        anim.animated_properties["y"] = playlist_container.height + self.app.navbar_height
+        anim.start(playlist_container)
 
-        player_container = self.ids.player_container
+        player_container = self._player_container
         player_container_y = (self.height - player_container.height - ((self.height - player_container.height) / 1.5))
         player_container_y += self.app.navbar_height
-        Animation(y=player_container_y, opacity=1, d=.2).start(player_container)
+        anim = self._container_up_anim
+        anim.animated_properties["y"] = player_container_y
+        anim.start(player_container)
 
-        player_preview = self.ids.player_preview
-        player_preview_y = -player_preview.height - self.app.navbar_height
-        anim = Animation(y=player_preview_y, opacity=0, d=.2)
-        anim.bind(on_complete=lambda *_: self.update_progress())
+        player_preview = self._player_preview
+        anim = self._preview_hide_anim
+        anim.animated_properties["y"] = -player_preview.height - self.app.navbar_height
         anim.start(player_preview)
 
     def push_down(self):
@@ -93,28 +170,26 @@ class PlayerScreen(BaseScreen):
         """
         self.update_progress.cancel()
 
-        Animation(opacity=1, d=.2).start(self.ids.rv)
+        self._rv_fade_in.start(self._rv)
 
-        overlay_btn = self.ids.overlay_btn
-        overlay_btn_y = -overlay_btn.height - dp(10)
-        Animation(y=overlay_btn_y, opacity=0, d=.2).start(self.ids.overlay_btn)
+        overlay_btn = self._overlay_btn
+        anim = self._overlay_hide_anim
+        anim.animated_properties["y"] = -overlay_btn.height - _OVERLAY_BTN_HIDE_MARGIN
+        anim.start(overlay_btn)
 
-        plc = self.ids.playlist_container
-        anim = Animation(y=self.height - plc.height, d=.2)
+        plc = self._playlist_container
+        anim = self._playlist_down_anim
+        anim.animated_properties["y"] = self.height - plc.height
         anim.start(plc)
 
-        player_container = self.ids.player_container
-        player_container_y = -player_container.height + dp(100)
-        anim = Animation(y=player_container_y, opacity=0, d=.2)
+        player_container = self._player_container
+        anim = self._container_down_anim
+        anim.animated_properties["y"] = -player_container.height + _CONTAINER_PEEK_HEIGHT
         anim.start(player_container)
 
-        player_preview = self.ids.player_preview
-        player_preview_y = 0
-        anim = Animation(y=player_preview_y, opacity=1, d=.2)
-        anim.bind(on_complete=lambda *_: self.update_progress())
-        anim.start(player_preview)
+        self._preview_show_anim.start(self._player_preview)
 
-        self.ids.rv.disabled = False
+        self._rv.disabled = False
 
     def _remove_overlay_button(self):
         """
@@ -154,7 +229,7 @@ class PlayerScreen(BaseScreen):
             self.update_progress.cancel()
             self.player.seek_to_media_item_index(music_index)
             self.player.play()
-            self.update_player_ui(self.ids.rv.data[music_index])
+            self.update_player_ui(self._rv.data[music_index])
 
         self.update_progress()
         self.set_pause_button()
@@ -238,8 +313,8 @@ class PlayerScreen(BaseScreen):
         :param self: Instance of the class where this method is called.
         :return: None
         """
-        self.ids.preview_play_btn.icon = "pause"
-        self.ids.container_play_btn.icon = "pause"
+        self._preview_play_btn.icon = "pause"
+        self._container_play_btn.icon = "pause"
 
     def set_play_button(self):
         """
@@ -250,8 +325,8 @@ class PlayerScreen(BaseScreen):
 
         :return: None
         """
-        self.ids.preview_play_btn.icon = "play"
-        self.ids.container_play_btn.icon = "play"
+        self._preview_play_btn.icon = "play"
+        self._container_play_btn.icon = "play"
 
     def request_audio_permission(self):
         """
@@ -267,8 +342,6 @@ class PlayerScreen(BaseScreen):
 
         :return: None
         """
-        from android.permissions import request_permissions, Permission  # noqa
-
         def callback(_, results):
             if not any(results):
                 return
@@ -300,8 +373,9 @@ class PlayerScreen(BaseScreen):
         UI elements to display the information of the first audio file in the playlist.
 
         The method initializes the ExoPlayer instance if it is not already initialized. It fetches
-        all audio files, generates media items for playback, and thumbnails for display if not present.
-        The playlist's UI elements are updated accordingly.
+        all audio files, then streams the playlist rows into the RecycleView in small batches
+        driven by the Clock, so the first screenful renders immediately while the rest of the
+        library keeps populating in the background.
 
         :param self: The instance of the class that contains this method.
         :raises KeyError: If any expected dictionary keys (e.g., 'uri', 'title', 'artist', 'data')
@@ -309,42 +383,217 @@ class PlayerScreen(BaseScreen):
         :raises ValueError: If there are issues processing media files or creating media items.
         :return: None
         """
+        _media_executor.submit(self._scan_audio_files)
 
-        media_items = []
-        audio_files = get_all_audio_files()
-        rv_data = []
+    def _scan_audio_files(self):
+        """
+        Queries the MediaStore for all audio files on a worker thread, so the
+        JNI round-trip never blocks rendering, then hands the result back to
+        the main thread. A failed scan is treated as an empty library.
 
+        :return: None
+        """
+        try:
+            audio_files = get_all_audio_files()
+        except Exception:
+            audio_files = []
+        serialized_items = None
+        if audio_files:
+            # media_item_from_uri is a plain factory and serialize only
+            # walks Java collections, so neither needs the main looper;
+            # keeping them here spares the render thread the JNI round
+            # trips for the whole library.
+            media_items = [
+                self.player.media_item_from_uri(music["uri"])
+                for music in audio_files
+            ]
+            serialized_items = serialize(media_items)
+        Clock.schedule_once(
+            lambda _dt: self._apply_playlist(audio_files, serialized_items)
+        )
+
+    def _apply_playlist(self, audio_files, serialized_items):
+        """
+        Applies the scanned audio files to the UI on the main thread, either
+        showing the empty-library state or kicking off the batched playlist
+        population.
+
+        :param audio_files: The audio file dictionaries from the MediaStore.
+        :type audio_files: list
+        :param serialized_items: The media items, already serialized for the
+            player by the worker thread.
+        :return: None
+        """
+        # update_playlist is re-entrant (e.g. the permission callback can
+        # fire twice); a still-running pump from the previous call must not
+        # survive into the rebuild, or it would keep pulling from a
+        # generator the new pump finalizes under it.
+        if self._pump_event is not None:
+            self._pump_event.cancel()
+            self._pump_event = None
+
+        if not audio_files:
+            self._rv.data = []
+            self._preview_title.text = "No music found"
+            self._container_title.text = "No music found"
+            self._preview_artist.text = "Empty"
+            self._container_artist.text = "Empty"
+            self._preview_thumbnail.source = _PLACEHOLDER_THUMBNAIL
+            self._container_thumbnail.source = _PLACEHOLDER_THUMBNAIL
+            return
+
+        self._rv.data = []
+        # Rows are tappable from the first pumped batch, so the player has
+        # to hold the new media items before the pump starts; otherwise a
+        # tap during population would seek into the previous (or an empty)
+        # playlist.
+        self.player.set_media_items(serialized_items)
+        self.player.prepare()
+        self._playlist_rows = self._build_playlist_rows(audio_files)
+        self._pump_event = Clock.schedule_interval(self._pump_playlist, 0)
+
+    def _build_playlist_rows(self, audio_files):
+        """
+        Lazily builds one RecycleView row per audio file, queueing thumbnail
+        extraction as a side effect. Being a generator, rows are only
+        produced as fast as `_pump_playlist` pulls them, which keeps each
+        frame's share of the work bounded.
+
+        :param audio_files: The audio file dictionaries from the MediaStore.
+        :type audio_files: list
+        :return: Generator of RecycleView row dictionaries.
+        """
+        cache_dir = app_dirs("ext_cache")
+        makedirs(cache_dir, exist_ok=True)
         for i, music in enumerate(audio_files):
             if music["thumbnail"]:
-                thumbnail_file = extract_thumbnail_file_from_mp3(music["data"], app_dirs("ext_cache"))
-                music["thumbnail"] = thumbnail_file
-            else:
-                music["thumbnail"] = "assets/images/thumbnail.png"
+                future = _media_executor.submit(
+                    extract_thumbnail_file_from_mp3, music["data"], cache_dir
+                )
+                future.add_done_callback(partial(self._on_thumbnail_ready, i))
+            music["thumbnail"] = _PLACEHOLDER_THUMBNAIL
 
-            rv_data.append({
+            yield {
                 "title": music["title"],
                 "artist": music["artist"],
                 "thumbnail": music["thumbnail"],
-                "on_release": lambda music_index=i: self.play(music_index)
-            })
-
-            media_items.append(self.player.media_item_from_uri(music["uri"]))
-
-        if not rv_data:
-            self.ids.rv.data = []
-            self.ids.preview_title.text = "No music found"
-            self.ids.container_title.text = "No music found"
-            self.ids.preview_artist.text = "Empty"
-            self.ids.container_artist.text = "Empty"
-            self.ids.preview_thumbnail.source = "assets/images/thumbnail.png"
-            self.ids.container_thumbnail.source = "assets/images/thumbnail.png"
+                "index": i
+            }
+
+    def _pump_playlist(self, _dt):
+        """
+        Clock callback that moves the next batch of rows from the playlist
+        generator into the RecycleView. Once the generator is exhausted the
+        interval stops itself and the playback listener is attached.
+
+        :param _dt: Time elapsed since the previous call, supplied by the Clock.
+        :return: False when the playlist is fully populated, to stop the interval.
+        """
+        rv = self._rv
+        batch = list(islice(self._playlist_rows, _PLAYLIST_BATCH_SIZE))
+        if batch:
+            first_batch = not rv.data
+            rv.data.extend(batch)
+            rv.refresh_from_data()
+            if first_batch:
+                self.update_player_ui(batch[0])
+        if len(batch) < _PLAYLIST_BATCH_SIZE:
+            self._playlist_rows = None
+            self._pump_event = None
+            self._attach_player_listener()
+            return False
+
+    def _attach_player_listener(self):
+        """
+        Registers this screen as a playback listener on the ExoPlayer bridge
+        when the installed kvdroid build exposes ``add_listener``, so track
+        changes and play/pause arrive as events instead of being discovered
+        by the progress poll. Bridges without listener support keep the
+        polling behaviour untouched.
+
+        :return: None
+        """
+        if self._listener_attached:
+            return
+        add_listener = getattr(self.player, "add_listener", None)
+        if add_listener is None:
             return
+        try:
+            add_listener(self)
+        except Exception:
+            # Degrade to polling on any bridge mismatch, including the
+            # JavaException pyjnius raises when add_listener wants a real
+            # Player.Listener rather than a Python object.
+            return
+        self._listener_attached = True
 
-        self.ids.rv.data = rv_data
-        self.update_player_ui(rv_data[0])
+    def onIsPlayingChanged(self, is_playing):  # noqa: N802 (ExoPlayer callback)
+        """
+        ExoPlayer listener callback. Runs the progress trigger only while
+        audio is actually playing, so the app stops waking up while paused.
 
-        self.player.set_media_items(serialize(media_items))
-        self.player.prepare()
+        :param is_playing: Whether the player is currently playing.
+        :type is_playing: bool
+        :return: None
+        """
+        if is_playing:
+            Clock.schedule_once(lambda _dt: self.update_progress())
+        else:
+            Clock.schedule_once(lambda _dt: self.update_progress.cancel())
+
+    def onMediaItemTransition(self, media_item, reason):  # noqa: N802
+        """
+        ExoPlayer listener callback. Refreshes the track labels as soon as
+        the player moves to another media item, without waiting for the
+        next progress poll.
+
+        :param media_item: The media item the player transitioned to.
+        :param reason: The transition reason reported by ExoPlayer.
+        :return: None
+        """
+        Clock.schedule_once(lambda _dt: self._on_media_index_changed())
+
+    def _on_media_index_changed(self):
+        index = self.player.get_current_media_item_index()
+        data = self._rv.data
+        if index != self._last_media_index and index < len(data):
+            self._last_media_index = index
+            self.update_player_ui(data[index])
+
+    def _on_thumbnail_ready(self, index, future):
+        """
+        Receives the result of a background thumbnail extraction and hands it
+        over to the main thread. Runs on a worker thread, so it must not touch
+        any widget directly; failed extractions keep the placeholder artwork.
+
+        :param index: Position of the track inside the RecycleView data.
+        :type index: int
+        :param future: The completed future holding the thumbnail path.
+        :type future: concurrent.futures.Future
+        :return: None
+        """
+        try:
+            thumbnail_file = future.result()
+        except Exception:
+            return
+        Clock.schedule_once(lambda _dt: self._patch_thumbnail(index, thumbnail_file))
+
+    def _patch_thumbnail(self, index, thumbnail_file):
+        """
+        Swaps the placeholder artwork of a playlist row for the extracted
+        thumbnail and refreshes the RecycleView so the row re-renders.
+
+        :param index: Position of the track inside the RecycleView data.
+        :type index: int
+        :param thumbnail_file: Path of the extracted thumbnail image.
+        :type thumbnail_file: str
+        :return: None
+        """
+        rv = self._rv
+        data = rv.data
+        if index < len(data):
+            data[index]["thumbnail"] = thumbnail_file
+            rv.refresh_from_data()
 
     @triggered(.5, True)
     def update_progress(self):
@@ -368,20 +617,29 @@ class PlayerScreen(BaseScreen):
         is_command_available = player.is_command_available(player.COMMAND_GET_CURRENT_MEDIA_ITEM)
 
         if is_command_available and not playback_ended:
-            self.update_player_ui(self.ids.rv.data[self.player.get_current_media_item_index()])
+            media_index = player.get_current_media_item_index()
+            if media_index != self._last_media_index:
+                self._last_media_index = media_index
+                self.update_player_ui(self._rv.data[media_index])
             current_position = player.get_current_position()
             duration = player.get_duration()
             if duration <= 0:
                 return
             progress = current_position / duration
-            self.ids.preview_progress.value = progress
-            self.ids.container_progress.value = progress
+            # Writing a Kivy property fires its observer chain, so skip the
+            # assignment when the change would not be visible anyway.
+            bucket = round(progress * 1000)
+            if bucket != self._last_progress_bucket:
+                self._last_progress_bucket = bucket
+                self._preview_progress.value = progress
+                self._container_progress.value = progress
 
         if playback_ended:
             self.update_progress.cancel()
             self.set_play_button()
-            self.ids.preview_progress.value = 0
-            self.ids.container_progress.value = 0
+            self._last_progress_bucket = 0
+            self._preview_progress.value = 0
+            self._container_progress.value = 0
 
     def update_player_ui(self, music_data):
         """
@@ -398,17 +656,18 @@ class PlayerScreen(BaseScreen):
 
         :return: None.
         """
-        self.ids.preview_title.text = music_data["title"]
-        self.ids.container_title.text = music_data["title"]
+        self._preview_title.text = music_data["title"]
+        self._container_title.text = music_data["title"]
 
-        self.ids.preview_artist.text = music_data["artist"]
-        self.ids.container_artist.text = music_data["artist"]
+        self._preview_artist.text = music_data["artist"]
+        self._container_artist.text = music_data["artist"]
 
-        self.ids.preview_thumbnail.source = music_data["thumbnail"]
-        self.ids.container_thumbnail.source = music_data["thumbnail"]
+        self._preview_thumbnail.source = music_data["thumbnail"]
+        self._container_thumbnail.source = music_data["thumbnail"]
 
-        self.ids.preview_progress.value = 0
-        self.ids.container_progress.value = 0
+        self._last_progress_bucket = 0
+        self._preview_progress.value = 0
+        self._container_progress.value = 0
 
 
 class PlayList(ButtonBehavior, BoxLayout):
@@ -427,7 +686,14 @@ class PlayList(ButtonBehavior, BoxLayout):
     :ivar thumbnail: The URL or path to the thumbnail image for the
         playlist item.
     :type thumbnail: str
+    :ivar index: Position of the item inside the playlist, used to seek
+        the player when the item is released.
+    :type index: int
     """
     title = StringProperty()
     artist = StringProperty()
     thumbnail = StringProperty()
+    index = NumericProperty()
+
+    def on_release(self):
+        App.get_running_app().sm.get_screen("player screen").play(self.index)
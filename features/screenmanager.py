@@ -1,3 +1,5 @@
+import threading
+
 from kivy import platform
 from kivy.app import App
 from kivy.core.window import Window
@@ -6,6 +8,11 @@ from kivy.uix.screenmanager import ScreenManager
 from importlib import import_module
 from components.bar import win_md_bnb
 
+if platform == "android":
+    from android import mActivity  # noqa
+else:
+    mActivity = None
+
 
 class AppScreenManager(ScreenManager):
     """
@@ -30,7 +37,27 @@ class AppScreenManager(ScreenManager):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._navbar_index = {}
+        self._navbar_index_source = None
         Window.bind(on_keyboard=self._go_back)
+        threading.Thread(target=self._preload_screens, daemon=True).start()
+
+    def _preload_screens(self):
+        """
+        Imports every registered presentation module on a background thread
+        so the first navigation to a screen only instantiates its class,
+        instead of paying the module import and kv parse on the UI thread.
+        Imports are thread-safe and only populate ``sys.modules``.
+
+        :return: None
+        """
+        for screen_data in self.screen_config.values():
+            presentation_module_path, _ = screen_data["presentation"]
+            try:
+                import_module(presentation_module_path)
+            except Exception:
+                # on_current will surface the real import error on demand.
+                pass
 
     def on_current(self, instance, value):
         """
@@ -81,12 +108,27 @@ class AppScreenManager(ScreenManager):
         """
         if key == 1073742106:
             if self.screens.index(self.current_screen) == 0 and platform == "android":
-                from android import mActivity
                 mActivity.moveTaskToBack(True)
                 return True
             self.current = self.previous()
-            for child in win_md_bnb.bar.children:
-                if self.current == child.name:
-                    child.dispatch("on_release")
+            child = self._navbar_children_by_name().get(self.current)
+            if child:
+                child.dispatch("on_release")
             return True
 
+    def _navbar_children_by_name(self):
+        """
+        Returns a name-to-item mapping of the navigation bar children,
+        rebuilt only when the bar's children change, so the back-key
+        handler resolves the active item with a dict lookup instead of a
+        linear scan.
+
+        :return: Mapping of screen name to navigation bar item.
+        :rtype: dict
+        """
+        children = win_md_bnb.bar.children if win_md_bnb.bar else []
+        if self._navbar_index_source is not children or len(children) != len(self._navbar_index):
+            self._navbar_index = {child.name: child for child in children}
+            self._navbar_index_source = children
+        return self._navbar_index
+
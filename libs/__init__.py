@@ -1,4 +1,6 @@
 # This package is for additional application modules.
+from functools import lru_cache
+
 from kivy.clock import Clock
 from kivy.core.text import Label
 from kivy.metrics import sp
@@ -6,6 +8,7 @@ from kivy.metrics import sp
 from libs.decorator import android_only
 
 
+@lru_cache(maxsize=4096)
 def shorten_text(text, lbl_width, lines=1, suffix="... See more", font_size=sp(12)):
     """
     Used to shorten text in kivy to number of lines you want unlike kivy which only shortens for
@@ -19,26 +22,58 @@ def shorten_text(text, lbl_width, lines=1, suffix="... See more", font_size=sp(1
     :return: returns shorten text
     """
     lbl = Label(font_size=font_size)
-    new_text = text
     text_width = lbl.get_cached_extents()
-    t = 0
     lbl_width *= lines
     if lbl_width <= 0:
         return ""
-    while text_width(new_text + suffix)[0] > lbl_width:
-        new_text = new_text.split(" ")
-        del new_text[-1]
-        new_text = " ".join(new_text)
-        if text_width(new_text + suffix)[0] == t:
-            return ""
-        t = text_width(new_text + suffix)[0]
-    return new_text + suffix
+    if text_width(text + suffix)[0] <= lbl_width:
+        return text + suffix
+    words = text.split(" ")
+    # Text width grows monotonically with word count, so binary search the
+    # largest prefix of words that still fits: O(log W) measurements
+    # instead of one per dropped word.
+    lo, hi = 0, len(words) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text_width(" ".join(words[:mid]) + suffix)[0] <= lbl_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    if lo == 0 and text_width(suffix)[0] > lbl_width:
+        return ""
+    return " ".join(words[:lo]) + suffix
 
 
 def compute_text_size(text, font_size, padding, widget_width):
     if len(padding) < 4 or not isinstance(padding, list):
         raise TypeError("padding must be a list and of length 4")
-    lbl = Label(text=text, font_size=font_size, padding=padding)
+    # Tuples make the call hashable so identical labels hit the cache.
+    return _compute_text_size(text, font_size, tuple(padding), widget_width)
+
+
+_extents_labels = {}
+
+
+def _text_extents(text, font_size):
+    lbl = _extents_labels.get(font_size)
+    if lbl is None:
+        lbl = _extents_labels[font_size] = Label(font_size=font_size)
+    return lbl.get_cached_extents()(text)
+
+
+@lru_cache(maxsize=4096)
+def _compute_text_size(text, font_size, padding, widget_width):
+    h_pad = padding[0] + padding[2]
+    if "\n" not in text:
+        # Cheap extents measurement first: most labels fit their widget,
+        # and the full Label(...).refresh() layout pass is pure overhead
+        # for them. The width/height swap mirrors the full path below.
+        text_w, text_h = _text_extents(text, font_size)
+        width = text_h + padding[1] + padding[3]
+        height = text_w + h_pad
+        if width <= (widget_width - h_pad):
+            return width, height
+    lbl = Label(text=text, font_size=font_size, padding=list(padding))
     lbl.refresh()
     height, width = lbl.size
     if width > (widget_width - (padding[0] + padding[2])):
@@ -50,15 +85,54 @@ def compute_text_size(text, font_size, padding, widget_width):
     return width, height
 
 
+def clear_text_caches():
+    """
+    Drops the memoized text measurements. Call this whenever the rendered
+    width of cached text can change, e.g. after swapping the app font.
+    """
+    shorten_text.cache_clear()
+    _compute_text_size.cache_clear()
+    _extents_labels.clear()
+
+
 def get_dict_pos(lst, key, value):
     return next((index for (index, d) in enumerate(lst) if d[key] == value), None)
 
 
-def search_dict(search_term, data_key, data, case_sensitive=False):
+def build_dict_index(lst, key):
+    """
+    Builds a value-to-position index for a list of dicts. Build it once and
+    use ``.get(value)`` instead of calling :func:`get_dict_pos` repeatedly
+    against the same list, which rescans the list on every lookup.
+
+    :param lst: list of dicts to index
+    :param key: dict key whose values become the index keys
+    :return: dict mapping each ``d[key]`` to its position in ``lst``
+    """
+    return {d[key]: index for index, d in enumerate(lst)}
+
+
+def build_search_index(data, data_key):
+    """
+    Precomputes the lowercased search field of every row. Pass the result
+    as the ``index`` argument of :func:`search_dict` so a search per
+    keystroke no longer lowercases the whole dataset each time.
+
+    :param data: list of dicts to be searched
+    :param data_key: dict key of the field being searched
+    :return: list of lowercased field values, parallel to ``data``
+    """
+    return [row[data_key].lower() for row in data]
+
+
+def search_dict(search_term, data_key, data, case_sensitive=False, index=None):
     if case_sensitive:
         a = filter(lambda search_found: search_term in search_found[data_key], data)
-    else:
-        a = filter(lambda search_found: search_term.lower() in search_found[data_key].lower(), data)
+        return list(a)
+    if index is not None:
+        search_term = search_term.lower()
+        return [row for row, field in zip(data, index) if search_term in field]
+    a = filter(lambda search_found: search_term.lower() in search_found[data_key].lower(), data)
     return list(a)
 
 
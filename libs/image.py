@@ -1,15 +1,135 @@
+import hashlib
+from functools import lru_cache
+
 from tinytag import TinyTag
-from os.path import basename, isdir, join
+from os import remove
+from os.path import exists, getmtime, join
+
+# Extensions the extractor can produce, most common first; used to probe
+# for an already extracted thumbnail before parsing the mp3 again.
+_THUMBNAIL_EXTENSIONS = ("jpeg", "jpg", "png")
+_CHUNK_SIZE = 64 * 1024
+
+
+def _thumbnail_stem(mp3_filename):
+    # Hash of the full source path: deterministic, filesystem-safe and,
+    # unlike replacing the "mp3" substring in the basename, immune to
+    # "mp3" occurring elsewhere in the name or to basename collisions
+    # across directories.
+    return hashlib.blake2b(mp3_filename.encode(), digest_size=8).hexdigest()
+
+
+def _synchsafe(raw):
+    return (raw[0] << 21) | (raw[1] << 14) | (raw[2] << 7) | raw[3]
+
+
+def _read_terminated(source, limit, width):
+    # Read a null-terminated field (1 byte wide for latin-1/utf-8 text,
+    # 2 bytes wide for utf-16) without running past the frame end.
+    terminator = b"\x00" * width
+    value = bytearray()
+    while source.tell() < limit:
+        chunk = source.read(width)
+        if len(chunk) < width:
+            return None
+        if chunk == terminator:
+            return bytes(value)
+        value += chunk
+    return None
+
+
+def _stream_apic_to_file(mp3_filename, dest_dir, stem):
+    """
+    Copy the embedded APIC image of an ID3v2.3/2.4 tag straight from the
+    mp3 into a file in ``dest_dir``, reading the payload in 64KB chunks so
+    the cover art is never materialized in memory. Returns the written
+    path, or None when the tag cannot be walked safely.
+    """
+    with open(mp3_filename, "rb") as source:
+        header = source.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return None
+        major = header[3]
+        flags = header[5]
+        # v2.2 frames and unsynchronised tags go through the fallback.
+        if major < 3 or major > 4 or flags & 0x80:
+            return None
+        tag_end = 10 + _synchsafe(header[6:10])
+        if flags & 0x40:  # extended header
+            raw_size = source.read(4)
+            if len(raw_size) < 4:
+                return None
+            if major == 4:
+                source.seek(_synchsafe(raw_size) - 4, 1)
+            else:
+                source.seek(int.from_bytes(raw_size, "big"), 1)
+        while source.tell() < tag_end:
+            frame_header = source.read(10)
+            if len(frame_header) < 10 or frame_header[0] == 0:
+                return None
+            if major == 4:
+                frame_size = _synchsafe(frame_header[4:8])
+            else:
+                frame_size = int.from_bytes(frame_header[4:8], "big")
+            if frame_header[:4] != b"APIC":
+                source.seek(frame_size, 1)
+                continue
+            # Nonzero frame flags mean the payload is not the raw image:
+            # compressed, encrypted, grouped, per-frame unsynchronised or
+            # prefixed with a data-length indicator. Copying it verbatim
+            # would cache a corrupt thumbnail, so those frames fall back.
+            if frame_header[8] or frame_header[9]:
+                return None
+            frame_end = source.tell() + frame_size
+            encoding = source.read(1)[0]
+            mime = _read_terminated(source, frame_end, 1)
+            if mime is None:
+                return None
+            source.seek(1, 1)  # picture type
+            description_width = 2 if encoding in (1, 2) else 1
+            if _read_terminated(source, frame_end, description_width) is None:
+                return None
+            remaining = frame_end - source.tell()
+            if remaining <= 0:
+                return None
+            ext = mime.decode("latin-1").rsplit("/", 1)[-1] or "jpeg"
+            path = join(dest_dir, f"{stem}.{ext}")
+            with open(path, "wb") as dest:
+                while remaining > 0:
+                    chunk = source.read(min(_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    remaining -= len(chunk)
+            if remaining > 0:
+                # Short read: a truncated image must not be returned, or
+                # the mtime probe would treat it as a cache hit forever.
+                remove(path)
+                return None
+            return path
+    return None
 
 
+@lru_cache(maxsize=2048)
 def extract_thumbnail_file_from_mp3(mp3_filename: str, dest_dir: str):
-    if not isdir(dest_dir):
-        raise ValueError("Destination directory must be a valid directory.")
+    # Callers guarantee dest_dir exists (it is created once per playlist
+    # scan), so no stat() is spent re-validating it per track.
+    stem = _thumbnail_stem(mp3_filename)
+    source_mtime = getmtime(mp3_filename)
+    for known_ext in _THUMBNAIL_EXTENSIONS:
+        cached_path = join(dest_dir, f"{stem}.{known_ext}")
+        if exists(cached_path) and getmtime(cached_path) >= source_mtime:
+            return cached_path
+    try:
+        path = _stream_apic_to_file(mp3_filename, dest_dir, stem)
+    except (OSError, IndexError):
+        path = None
+    if path:
+        return path
     tag = TinyTag.get(mp3_filename, image=True)
     data = tag.images.any.data
     ext = tag.images.any.mime_type.split("/")[-1]
-    filename = basename(mp3_filename).replace("mp3", ext)
-    path = join(dest_dir, filename)
+    path = join(dest_dir, f"{stem}.{ext}")
     with open(path, "wb") as f:
         f.write(data)
     return path
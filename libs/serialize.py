@@ -1,5 +1,25 @@
 from jnius import autoclass
 
+# JNI class lookups resolved once at import; every inline autoclass call
+# costs a FindClass round-trip plus a cache probe per element otherwise.
+_HashMap = autoclass("java.util.HashMap")
+_ArrayList = autoclass("java.util.ArrayList")
+_Boolean = autoclass("java.lang.Boolean")
+_Long = autoclass("java.lang.Long")
+_Double = autoclass("java.lang.Double")
+_String = autoclass("java.lang.String")
+_Arrays = autoclass("java.util.Arrays")
+# Interface refs used to discriminate container kinds. pyjnius reflects
+# the Java hierarchy into the Python MRO, so isinstance against these is
+# a plain pointer walk with no JNI call, unlike a hasattr probe that
+# resolves the attribute through the Java class.
+_Map = autoclass("java.util.Map")
+_Iterable = autoclass("java.lang.Iterable")
+
+# Types serialize() hands back untouched; checked first so leaf values
+# exit on one frozenset probe instead of walking the container checks.
+_PRIMITIVE_TYPES = frozenset({int, float, str, bytes, type(None)})
+
 
 def serialize_map_to_dict(hash_map):
     """
@@ -18,14 +38,7 @@ def serialize_map_to_dict(hash_map):
     :rtype: dict
     """
     map_to_dict_data = {}
-
-    for key, value in zip(hash_map, hash_map.values()):
-        if hasattr(value, "put"):
-            map_to_dict_data[key] = serialize_map_to_dict(value)
-        elif hasattr(value, "iterator"):
-            map_to_dict_data[key] = serialize_array_to_list(value)
-        else:
-            map_to_dict_data[key] = value
+    _fill_from_java([(map_to_dict_data, hash_map)])
     return map_to_dict_data
 
 
@@ -46,17 +59,71 @@ def serialize_array_to_list(array):
     :rtype: list
     """
     array_to_list_data = []
+    _fill_from_java([(array_to_list_data, array)])
+    return array_to_list_data
 
-    for value in array:
-        if hasattr(value, "iterator"):
-            data = serialize_array_to_list(value)
-            array_to_list_data.append(data)
-        elif hasattr(value, "put"):
-            data = serialize_map_to_dict(value)
-            array_to_list_data.append(data)
+
+def _fill_from_java(stack):
+    # Iterative worklist shared by both deserializers: nested containers
+    # are allocated empty, placed into their parent immediately (which
+    # preserves ordering) and pushed for a later fill. No Python frame is
+    # created per nested node and arbitrarily deep structures cannot hit
+    # the recursion limit.
+    while stack:
+        container, java_obj = stack.pop()
+        if type(container) is dict:
+            # A single entrySet() walk crosses JNI once per entry, where
+            # zip(map, map.values()) iterated the map twice and built a
+            # second Collection view for the values.
+            iterator = java_obj.entrySet().iterator()
+            while iterator.hasNext():
+                entry = iterator.next()
+                key = entry.getKey()
+                value = entry.getValue()
+                if isinstance(value, _Map):
+                    container[key] = child = {}
+                    stack.append((child, value))
+                elif isinstance(value, _Iterable):
+                    container[key] = child = []
+                    stack.append((child, value))
+                else:
+                    container[key] = value
         else:
-            array_to_list_data.append(value)
-    return array_to_list_data
+            size = getattr(java_obj, "size", None)
+            # Both probes are needed: every Collection has size(), but
+            # only List has get(int) — a HashSet or ArrayDeque must stay
+            # on the iterator path below.
+            get = getattr(java_obj, "get", None) if size is not None else None
+            if get is not None:
+                # java.util.List path: preallocating from size() and
+                # reading through get(i) skips the list-growth
+                # reallocations and the Java Iterator object that the
+                # iteration protocol would wrap per container.
+                n = size()
+                container[:] = [None] * n
+                for i in range(n):
+                    value = get(i)
+                    if isinstance(value, _Iterable):
+                        container[i] = child = []
+                        stack.append((child, value))
+                    elif isinstance(value, _Map):
+                        container[i] = child = {}
+                        stack.append((child, value))
+                    else:
+                        container[i] = value
+                continue
+            append = container.append
+            for value in java_obj:
+                if isinstance(value, _Iterable):
+                    child = []
+                    append(child)
+                    stack.append((child, value))
+                elif isinstance(value, _Map):
+                    child = {}
+                    append(child)
+                    stack.append((child, value))
+                else:
+                    append(value)
 
 
 def serialize_dict_to_map(dictionary):
@@ -71,33 +138,21 @@ def serialize_dict_to_map(dictionary):
     :return: A Java `HashMap` object representing the serialized structure of the input Python dictionary.
     :rtype: java.util.HashMap
     """
-    dict_to_map_data = autoclass("java.util.HashMap")()
+    # Capacity sized for the final entry count (load factor .75), so the
+    # map never rehashes while it is filled.
+    dict_to_map_data = _HashMap(max(16, int(len(dictionary) / 0.75) + 1))
 
+    # Bound once: resolving .put through pyjnius costs a method lookup
+    # per call otherwise.
+    put = dict_to_map_data.put
+    dispatch = _JAVA_DISPATCH.get
     for key, value in dictionary.items():
-        if isinstance(value, dict):
-            data = serialize_dict_to_map(value)
-            dict_to_map_data.put(key, data)
-        elif isinstance(value, list):
-            data = serialize_list_to_array(value)
-            dict_to_map_data.put(key, data)
-        elif isinstance(value, bool):
-            Boolean = autoclass("java.lang.Boolean")
-            dict_to_map_data.put(key, Boolean(value))
-        elif isinstance(value, int):
-            Long = autoclass("java.lang.Long")
-            dict_to_map_data.put(key, Long(value))
-        elif isinstance(value, float):
-            Double = autoclass("java.lang.Double")
-            dict_to_map_data.put(key, Double(value))
-        elif isinstance(value, str):
-            String = autoclass("java.lang.String")
-            dict_to_map_data.put(key, String(value))
-        else:
-            dict_to_map_data.put(key, value)
+        handler = dispatch(type(value))
+        put(key, handler(value) if handler else value)
     return dict_to_map_data
 
 
-def serialize_list_to_array(list_):
+def serialize_list_to_array(list_, bulk=False):
     """
     Converts a Python list to a Java ArrayList and handles nested structures
     and data type conversions. Elements in the input list are recursively
@@ -108,37 +163,79 @@ def serialize_list_to_array(list_):
                   including integers, floats, booleans, strings, nested lists,
                   and dictionaries.
     :type list_: list
+    :param bulk: When True, a list made purely of ints, floats or strings
+                 is handed to Java as a single bulk-marshalled array and
+                 returned as the fixed-size List view backed by it. Ints
+                 box as Integer on this path instead of Long, so only
+                 enable it for consumers that accept both.
+    :type bulk: bool
     :returns: A Java ArrayList containing the converted elements suitable
-              for Java interoperability.
-    :rtype: java.util.ArrayList
+              for Java interoperability (or a fixed-size List on the bulk
+              path).
+    :rtype: java.util.List
     """
-    list_to_array_data = autoclass("java.util.ArrayList")()
+    if list_:
+        scalar_type = _scalar_list_type(list_)
+        if bulk and scalar_type is not None:
+            # One JNI crossing, no per-element boxing calls and no copy.
+            return _Arrays.asList(list_)
+        if scalar_type is float or scalar_type is str:
+            # pyjnius marshals the whole Python list into the Object[]
+            # varargs of Arrays.asList in one JNI crossing; the ArrayList
+            # constructor then copies it into a mutable list Java-side.
+            # Two calls total instead of one add() per element. floats and
+            # strs only: ints must keep their explicit Long boxing below.
+            return _ArrayList(_Arrays.asList(list_))
+
+    # Exact capacity up front: the default constructor starts at 10 and
+    # grow-copies its backing array as elements arrive.
+    list_to_array_data = _ArrayList(len(list_))
 
+    add = list_to_array_data.add
+    dispatch = _JAVA_DISPATCH.get
     for value in list_:
-        if isinstance(value, list):
-            data = serialize_list_to_array(value)
-            list_to_array_data.add(data)
-        elif isinstance(value, dict):
-            data = serialize_dict_to_map(value)
-            list_to_array_data.add(data)
-        elif isinstance(value, bool):
-            Boolean = autoclass("java.lang.Boolean")
-            list_to_array_data.add(Boolean(value))
-        elif isinstance(value, int):
-            Long = autoclass("java.lang.Long")
-            list_to_array_data.add(Long(value))
-        elif isinstance(value, float):
-            Double = autoclass("java.lang.Double")
-            list_to_array_data.add(Double(value))
-        elif isinstance(value, str):
-            String = autoclass("java.lang.String")
-            list_to_array_data.add(String(value))
-        else:
-            list_to_array_data.add(value)
+        handler = dispatch(type(value))
+        add(handler(value) if handler else value)
     return list_to_array_data
 
 
-def serialize(data, raw_python=False):
+def _scalar_list_type(list_):
+    # The scalar type shared by every element, or None for mixed, nested
+    # or non-scalar lists.
+    first_type = type(list_[0])
+    if first_type is not int and first_type is not float and first_type is not str:
+        return None
+    if all(type(value) is first_type for value in list_):
+        return first_type
+    return None
+
+
+# Python type -> Java converter, probed with type(value) so each element
+# costs one dict get instead of an isinstance ladder. Keying on the exact
+# type also keeps bool (a subclass of int) out of the Long branch without
+# needing a carefully ordered chain.
+_JAVA_DISPATCH = {
+    bool: _Boolean,
+    int: _Long,
+    float: _Double,
+    str: _String,
+    list: serialize_list_to_array,
+    dict: serialize_dict_to_map,
+}
+
+
+def _to_java(value):
+    """
+    Converts a single Python value to its Java counterpart via the shared
+    dispatch table, passing through anything without a registered
+    converter. The serializer loops inline the same table lookup for
+    speed; this helper exists for the one-off call sites.
+    """
+    handler = _JAVA_DISPATCH.get(type(value))
+    return handler(value) if handler else value
+
+
+def serialize(data, raw_python=False, bulk=False):
     """
     Serializes Python data structures into formats compatible with specific Java objects
     or back. Handles lists, dictionaries, iterables with Java-compatible attributes,
@@ -151,6 +248,9 @@ def serialize(data, raw_python=False):
     :param raw_python: A boolean flag indicating whether to perform raw Python
         serialization. Supported only for lists and their compatible elements.
     :type raw_python: bool
+    :param bulk: Passed through to :func:`serialize_list_to_array`; enables
+        the single-crossing array path for homogeneous scalar lists.
+    :type bulk: bool
     :return: The serialized Java-compatible representation of the input data,
         or the original data when no serialization is applicable.
     :rtype: Any
@@ -159,55 +259,35 @@ def serialize(data, raw_python=False):
         a list, or if a data type within the list is not supported.
     """
     if raw_python:
-        if not isinstance(data, list):
+        if type(data) is not list:
             raise Exception(f"raw `{type(data)}` serialization not supported")
-        raw_data = []
-        for value in data:
-            if isinstance(value, list):
-                data = serialize_list_to_array(value)
-                raw_data.append(data)
-            elif isinstance(value, dict):
-                data = serialize_dict_to_map(value)
-                raw_data.append(data)
-            elif isinstance(value, bool):
-                Boolean = autoclass("java.lang.Boolean")
-                raw_data.append(Boolean(value))
-            elif isinstance(value, int):
-                Long = autoclass("java.lang.Long")
-                raw_data.append(Long(value))
-            elif isinstance(value, float):
-                Double = autoclass("java.lang.Double")
-                raw_data.append(Double(value))
-            elif isinstance(value, str):
-                String = autoclass("java.lang.String")
-                raw_data.append(String(value))
-            else:
-                raw_data.append(value)
-        return raw_data
-    if isinstance(data, dict):
+        return [_to_java(value) for value in data]
+    if type(data) in _PRIMITIVE_TYPES:
+        return data
+    if type(data) is dict:
         return serialize_dict_to_map(data)
-    if isinstance(data, list):
-        return serialize_list_to_array(data)
-    if hasattr(data, "iterator"):
+    if type(data) is list:
+        return serialize_list_to_array(data, bulk)
+    if isinstance(data, _Iterable):
         return serialize_array_to_list(data)
-    if hasattr(data, "put"):
+    if isinstance(data, _Map):
         return serialize_map_to_dict(data)
     return data
 
 
 if __name__ == "__main__":
     # Serialize Java map to Python dictionary
-    hm = autoclass("java.util.HashMap")()
+    hm = _HashMap()
     hm.put("ada", "kene")
     hm.put("kene", "ada")
 
-    bm = autoclass("java.util.HashMap")()
+    bm = _HashMap()
     bm.put("ken", 1)
     bm.put(2, 3)
 
-    cm = autoclass("java.util.HashMap")()
+    cm = _HashMap()
 
-    ar = autoclass("java.util.ArrayList")()
+    ar = _ArrayList()
     ar.add(1)
     ar.add(2)
     ar.add(bm)
@@ -218,11 +298,11 @@ if __name__ == "__main__":
     print(serialize_map_to_dict(hm))
 
     # Serialize Java array to Python list
-    al = autoclass("java.util.ArrayList")()
+    al = _ArrayList()
     al.add(1)
     al.add("ada")
 
-    dm = autoclass("java.util.HashMap")()
+    dm = _HashMap()
     dm.put("ada", "kene")
 
     al.add(dm)
@@ -81,30 +81,43 @@ class MusicPlayerApp(App):
         """
         super().__init__(**kwargs)
         self.sm = None
+        self._box = None
         self.theme_cls = ThemeManager()
         # self.theme_cls.theme_style = "Dark"
         if platform == "android":
             from kvdroid.tools import change_statusbar_color, navbar_color
-            change_statusbar_color(
-                [0, 0, 0, 0],
-                "black" if self.theme_cls.theme_style == "Light" else "white"
-            )
-            navbar_color(
-                [0, 0, 0, 0],
-                "white" if self.theme_cls.theme_style == "Light" else "black"
-            )
-            self.theme_cls.bind(
-                bg_color=lambda _, value: (
-                    change_statusbar_color(
-                        [0, 0, 0, 0],
-                        "black" if self.theme_cls.theme_style == "Light" else "white"
-                    ),
-                    navbar_color(
-                        [0, 0, 0, 0],
-                        "white" if self.theme_cls.theme_style == "Light" else "black"
-                    )
-                )
-            )
+            self._change_statusbar_color = change_statusbar_color
+            self._navbar_color = navbar_color
+            self._transparent = [0, 0, 0, 0]
+            self._update_bar_icon_colors()
+            self._apply_bar_colors()
+            # fbind with a bound method: no per-dispatch closure-cell reads
+            # and Kivy's fast-bind path instead of the kwargs one. The icon
+            # color strings only depend on theme_style, so bg_color updates
+            # reuse the cached pair.
+            self.theme_cls.fbind("theme_style", self._on_theme_style)
+            self.theme_cls.fbind("bg_color", self._apply_bar_colors)
+
+    def _update_bar_icon_colors(self):
+        # The two bars are deliberately inverted: dark status bar icons on
+        # a light theme, light navigation bar icons on a light theme.
+        light = self.theme_cls.theme_style == "Light"
+        self._statusbar_icon_color = "black" if light else "white"
+        self._navbar_icon_color = "white" if light else "black"
+
+    def _on_theme_style(self, *_):
+        self._update_bar_icon_colors()
+        self._apply_bar_colors()
+
+    def _apply_bar_colors(self, *_):
+        """
+        Repaints the transparent status and navigation bars with the icon
+        colors cached for the active theme style.
+
+        :return: None
+        """
+        self._change_statusbar_color(self._transparent, self._statusbar_icon_color)
+        self._navbar_color(self._transparent, self._navbar_icon_color)
 
     def build(self):
         """
@@ -121,19 +134,28 @@ class MusicPlayerApp(App):
             screen manager and platform-specific behavior configurations.
         """
         self.sm = AppScreenManager(transition=SharedAxisTransition())
-        box = BoxLayout()
+        self._box = box = BoxLayout()
         box.add_widget(self.sm)
         if platform == "android":
-            self.sm.bind(
-                current=lambda _, name: (
-                    setattr(box, "padding", [0, self.statusbar_height, 0, self.navbar_height])
-                    if name != "player screen" else
-                    setattr(box, "padding", [0, 0, 0, 0])
-                )
-            )
+            self._padding_default = [0, self.statusbar_height, 0, self.navbar_height]
+            self._padding_player = [0, 0, 0, 0]
+            self.sm.fbind("current", self._on_screen_change)
         self.sm.current = "player screen"
         return box
 
+    def _on_screen_change(self, _, name):
+        """
+        Swaps the root padding between the precomputed edge-to-edge layout
+        of the player screen and the bar-aware layout of every other screen.
+
+        :param _: The screen manager dispatching the change.
+        :param name: The name of the screen being shown.
+        :return: None
+        """
+        self._box.padding = (
+            self._padding_player if name == "player screen" else self._padding_default
+        )
+
 
 if __name__ == '__main__':
     import trio
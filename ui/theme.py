@@ -1,5 +1,5 @@
 from kivy.app import App
-from kivy.clock import mainthread
+from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.event import EventDispatcher
 from kivy.properties import ColorProperty, OptionProperty, ObjectProperty
@@ -104,21 +104,46 @@ class ThemeManager(EventDispatcher):
         :type kwargs: dict
         """
         super().__init__(*args, **kwargs)
+        # The per-style colors never change after construction, so both
+        # palettes are resolved once here; set_theme then applies the
+        # active one without re-reading seven properties per call.
+        self._palettes = {
+            "Light": (
+                self.bg_color_light,
+                self.primary_color_light,
+                self.secondary_color_light,
+                self.accent_color_light,
+                self.text_color_light,
+                self.shadow_color_light,
+                self.card_color_light,
+            ),
+            "Dark": (
+                self.bg_color_dark,
+                self.primary_color_dark,
+                self.secondary_color_dark,
+                self.accent_color_dark,
+                self.text_color_dark,
+                self.shadow_color_dark,
+                self.card_color_dark,
+            ),
+        }
+        # A zero-timeout trigger coalesces any number of style changes in
+        # a frame into one set_theme call, and always runs it on the Kivy
+        # thread, which is what the previous @mainthread decorator ensured.
+        self._theme_trigger = Clock.create_trigger(self.set_theme)
         self.on_theme_style()
 
-    @mainthread
     def on_theme_style(self, *_):
         """
         The on_theme_style method is a callback designed to respond to changes in
-        the theme style of the application. This method ensures that the theme is
-        updated dynamically by calling the set_theme method whenever the theme style
-        is modified. This function is intended to handle signals or events related
-        to changes in the style theme.
+        the theme style of the application. It fires the coalescing trigger so
+        that however many times the style changes within a frame, the theme
+        (and the Window viewport update it entails) is applied once.
 
         :param _: Arguments passed to the callback, typically ignored in this implementation.
         :return: None
         """
-        self.set_theme()
+        self._theme_trigger()
 
     def set_theme(self, *_):
         """
@@ -135,27 +160,33 @@ class ThemeManager(EventDispatcher):
         :param _: Accepts any arguments, though they are unused within the method.
         :return: None
         """
-        if self.theme_style == "Light":
-            self.bg_color = self.bg_color_light
-            self.primary_color = self.primary_color_light
-            self.secondary_color = self.secondary_color_light
-            self.accent_color = self.accent_color_light
-            self.text_color = self.text_color_light
-            self.shadow_color = self.shadow_color_light
-            self.card_color = self.card_color_light
-        else:
-            self.bg_color = self.bg_color_dark
-            self.primary_color = self.primary_color_dark
-            self.secondary_color = self.secondary_color_dark
-            self.accent_color = self.accent_color_dark
-            self.text_color = self.text_color_dark
-            self.shadow_color = self.shadow_color_dark
-            self.card_color = self.card_color_dark
+        (
+            self.bg_color,
+            self.primary_color,
+            self.secondary_color,
+            self.accent_color,
+            self.text_color,
+            self.shadow_color,
+            self.card_color,
+        ) = self._palettes[self.theme_style]
 
         Window.clearcolor = self.bg_color
         Window.update_viewport()
 
 
+_app_theme_cls = None
+
+
+def _get_theme_cls():
+    # Theme.__init__ runs for every themed widget; the running app's
+    # ThemeManager never changes for the life of the process, so resolve
+    # it through App.get_running_app() only once.
+    global _app_theme_cls
+    if _app_theme_cls is None:
+        _app_theme_cls = App.get_running_app().theme_cls
+    return _app_theme_cls
+
+
 class Theme:
     """
     Represents a theme management class for a UI application.
@@ -171,5 +202,5 @@ class Theme:
     theme_cls = ObjectProperty()
 
     def __init__(self, *args, **kwargs):
-        self.theme_cls = App.get_running_app().theme_cls
+        self.theme_cls = _get_theme_cls()
         super().__init__(*args, **kwargs)